@@ -6,6 +6,7 @@ import dataclasses
 import logging
 import re
 from dataclasses import dataclass
+from functools import cache
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -20,11 +21,13 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from vi_api_client.api import Feature
 
-from .const import DOMAIN, IGNORED_FEATURES, TESTED_DEVICES
+from .const import DOMAIN, IGNORED_FEATURE_PATTERNS, IGNORED_FEATURES, TESTED_DEVICES
 from .coordinator import ViClimateDataUpdateCoordinator
 from .utils import (
     beautify_name,
     get_feature_bool_value,
+    get_template_candidates,
+    index_templates,
     is_feature_boolean_like,
     is_feature_ignored,
 )
@@ -90,6 +93,8 @@ BINARY_SENSOR_TEMPLATES = [
     },
 ]
 
+_BINARY_SENSOR_TEMPLATE_INDEX = index_templates(BINARY_SENSOR_TEMPLATES)
+
 BINARY_SENSOR_TYPES: dict[str, BinarySensorEntityDescription] = {
     # DHW Charging (heating.dhw.charging)
     "heating.dhw.charging": BinarySensorEntityDescription(
@@ -130,6 +135,7 @@ BINARY_SENSOR_TYPES: dict[str, BinarySensorEntityDescription] = {
 }
 
 
+@cache
 def _get_binary_sensor_entity_description(
     feature_name: str,
 ) -> tuple[BinarySensorEntityDescription, dict[str, str] | None] | None:
@@ -138,7 +144,8 @@ def _get_binary_sensor_entity_description(
     Returns:
         tuple: (description, translation_placeholders) or None
     """
-    for template in BINARY_SENSOR_TEMPLATES:
+    candidates = get_template_candidates(_BINARY_SENSOR_TEMPLATE_INDEX, feature_name)
+    for template in candidates:
         match = template["pattern"].match(feature_name)
         if match:
             index = match.group(1)
@@ -166,13 +173,16 @@ async def async_setup_entry(
 
     if coordinator.data:
         for map_key, device in coordinator.data.items():
+            # Only disable entities by default for thoroughly tested devices
+            is_tested = device.model_id in TESTED_DEVICES
             for feature in device.features:
                 # Skip ignored features early
-                if is_feature_ignored(feature.name, IGNORED_FEATURES):
+                if is_feature_ignored(
+                    feature.name, IGNORED_FEATURES, IGNORED_FEATURE_PATTERNS
+                ):
                     continue
 
-                if feature.name in BINARY_SENSOR_TYPES:
-                    description = BINARY_SENSOR_TYPES[feature.name]
+                if description := BINARY_SENSOR_TYPES.get(feature.name):
                     entities.append(
                         ViClimateBinarySensor(
                             coordinator, map_key, feature.name, description
@@ -201,8 +211,6 @@ async def async_setup_entry(
                         name=beautify_name(feature.name),
                         entity_category=EntityCategory.DIAGNOSTIC,
                     )
-                    # Only disable entities by default for thoroughly tested devices
-                    is_tested = device.model_id in TESTED_DEVICES
                     entities.append(
                         ViClimateBinarySensor(
                             coordinator,
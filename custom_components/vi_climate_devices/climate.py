@@ -24,7 +24,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from vi_api_client import Feature
+from vi_api_client import Device, Feature
 
 from .const import DOMAIN
 from .coordinator import ViClimateDataUpdateCoordinator
@@ -134,6 +134,11 @@ class ViClimate(CoordinatorEntity, ClimateEntity):
         self._attr_has_entity_name = True
         self._attr_translation_placeholders = {"index": circuit_index}
 
+        # Program features are indexed once per device object from the coordinator.
+        self._indexed_device: Device | None = None
+        self._program_names: set[str] = set()
+        self._program_temperature_names: dict[str, str] = {}
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
@@ -157,6 +162,40 @@ class ViClimate(CoordinatorEntity, ClimateEntity):
             return None
         return device.get_feature(name)
 
+    def _index_programs(self, device: Device) -> None:
+        """Index the operating program features of this circuit by name."""
+        if device is self._indexed_device:
+            return
+
+        prefix = f"heating.circuits.{self._circuit_index}.operating.programs."
+        program_names: set[str] = set()
+        temperature_names: dict[str, str] = {}
+        for feature in device.features:
+            if not feature.name.startswith(prefix):
+                continue
+            program_names.add(feature.name[len(prefix) :].split(".")[0])
+            if feature.name.endswith(".temperature"):
+                # Extract program name part:
+                # e.g., '...normalHeating.temperature' -> 'normalHeating'
+                prog_part = feature.name[len(prefix) : -len(".temperature")]
+                # Keep the first feature per base name, like the previous scan.
+                temperature_names.setdefault(
+                    self._get_program_base_name(prog_part), feature.name
+                )
+
+        self._program_names = program_names
+        self._program_temperature_names = temperature_names
+        self._indexed_device = device
+
+    def _get_program_names(self) -> set[str]:
+        """Get the operating program names available for this circuit."""
+        device = self.coordinator.data.get(self._map_key)
+        if not device:
+            return set()
+
+        self._index_programs(device)
+        return self._program_names
+
     def _get_program_base_name(self, program_name: str) -> str:
         """Get the base prefix of a program name (e.g., 'normalHeating' -> 'normal')."""
         program_lower = program_name.lower()
@@ -190,14 +229,9 @@ class ViClimate(CoordinatorEntity, ClimateEntity):
         if not device:
             return None
 
-        prefix = f"heating.circuits.{self._circuit_index}.operating.programs."
-        for feat in device.features:
-            if feat.name.startswith(prefix) and feat.name.endswith(".temperature"):
-                # Extract program name part:
-                # e.g., '...normalHeating.temperature' -> 'normalHeating'
-                prog_part = feat.name[len(prefix) : -len(".temperature")]
-                if self._get_program_base_name(prog_part) == target_base:
-                    return feat
+        self._index_programs(device)
+        if matched_name := self._program_temperature_names.get(target_base):
+            return device.get_feature(matched_name)
 
         return None
 
@@ -314,7 +348,7 @@ class ViClimate(CoordinatorEntity, ClimateEntity):
             if option in API_TO_HA_HVAC_MODE:
                 modes.add(API_TO_HA_HVAC_MODE[option])
 
-        return sorted(list(modes))
+        return sorted(modes)
 
     @property
     def preset_mode(self) -> str | None:
@@ -330,21 +364,12 @@ class ViClimate(CoordinatorEntity, ClimateEntity):
     @property
     def preset_modes(self) -> list[str]:
         """Return a list of available preset modes."""
-        presets = set()
-        device = self.coordinator.data.get(self._map_key)
-        if not device:
-            return []
-
-        prefix = f"heating.circuits.{self._circuit_index}.operating.programs."
-        for feature in device.features:
-            if feature.name.startswith(prefix):
-                parts = feature.name[len(prefix) :].split(".")
-                if parts:
-                    program_name = parts[0]
-                    if program_name in API_TO_HA_PRESET:
-                        presets.add(API_TO_HA_PRESET[program_name])
-
-        return sorted(list(presets))
+        presets = {
+            API_TO_HA_PRESET[program_name]
+            for program_name in self._get_program_names()
+            if program_name in API_TO_HA_PRESET
+        }
+        return sorted(presets)
 
     # --- Actions ---
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import re
 from dataclasses import dataclass, replace
+from functools import lru_cache
 from typing import Any
 
 from homeassistant.components.number import (
@@ -22,14 +23,23 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from vi_api_client import Feature
 
-from .const import DOMAIN, IGNORED_FEATURES, TESTED_DEVICES
+from .const import DOMAIN, IGNORED_FEATURE_PATTERNS, IGNORED_FEATURES, TESTED_DEVICES
 from .coordinator import ViClimateDataUpdateCoordinator
-from .utils import beautify_name, get_suggested_precision, is_feature_ignored
+from .utils import (
+    beautify_name,
+    get_suggested_precision,
+    get_template_candidates,
+    index_templates,
+    is_feature_ignored,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Matches every uppercase letter except a leading one (camelCase -> snake_case).
+_UPPERCASE_SPLIT = re.compile(r"(?<!^)(?=[A-Z])")
+
 
-@dataclass
+@dataclass(frozen=True, kw_only=True)
 class ViClimateNumberEntityDescription(NumberEntityDescription):
     """Custom description for ViClimate number entities."""
 
@@ -101,6 +111,8 @@ NUMBER_TEMPLATES = [
     },
 ]
 
+_NUMBER_TEMPLATE_INDEX = index_templates(NUMBER_TEMPLATES)
+
 NUMBER_TYPES: dict[str, ViClimateNumberEntityDescription] = {
     "heating.dhw.temperature.hysteresis": ViClimateNumberEntityDescription(
         key="heating.dhw.temperature.hysteresis",
@@ -146,11 +158,13 @@ NUMBER_TYPES: dict[str, ViClimateNumberEntityDescription] = {
 }
 
 
+@lru_cache(maxsize=512)
 def _get_number_entity_description(
     feature_name: str,
 ) -> tuple[ViClimateNumberEntityDescription, dict[str, str] | None] | None:
     """Find a matching entity description for a dynamic feature name."""
-    for template in NUMBER_TEMPLATES:
+    candidates = get_template_candidates(_NUMBER_TEMPLATE_INDEX, feature_name)
+    for template in candidates:
         match = template["pattern"].match(feature_name)
         if match:
             groups = match.groups()
@@ -166,7 +180,7 @@ def _get_number_entity_description(
 
             # Program specific logic
             if program:
-                program_snake = re.sub(r"(?<!^)(?=[A-Z])", "_", program).lower()
+                program_snake = _UPPERCASE_SPLIT.sub("_", program).lower()
                 new_trans_key = f"heating_circuit_program_{program_snake}_temperature"
                 # No program in placeholder for specific key if desired
                 # but we kept index.
@@ -193,14 +207,17 @@ async def async_setup_entry(
 
     if coordinator.data:
         for map_key, device in coordinator.data.items():
+            # Only disable entities by default for thoroughly tested devices
+            is_tested = device.model_id in TESTED_DEVICES
             for feature in device.features:
                 # Skip ignored features early
-                if is_feature_ignored(feature.name, IGNORED_FEATURES):
+                if is_feature_ignored(
+                    feature.name, IGNORED_FEATURES, IGNORED_FEATURE_PATTERNS
+                ):
                     continue
 
                 # 1. Defined Entities
-                if feature.name in NUMBER_TYPES:
-                    desc = NUMBER_TYPES[feature.name]
+                if desc := NUMBER_TYPES.get(feature.name):
                     entities.append(
                         ViClimateNumber(coordinator, map_key, feature.name, desc)
                     )
@@ -233,8 +250,6 @@ async def async_setup_entry(
                         name=beautify_name(feature.name),
                         entity_category=EntityCategory.CONFIG,
                     )
-                    # Only disable entities by default for thoroughly tested devices
-                    is_tested = device.model_id in TESTED_DEVICES
                     entities.append(
                         ViClimateNumber(
                             coordinator,
@@ -6,6 +6,7 @@ import dataclasses
 import logging
 import re
 from dataclasses import dataclass
+from functools import cache
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
@@ -17,9 +18,14 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from vi_api_client import Feature
 
-from .const import DOMAIN, IGNORED_FEATURES, TESTED_DEVICES
+from .const import DOMAIN, IGNORED_FEATURE_PATTERNS, IGNORED_FEATURES, TESTED_DEVICES
 from .coordinator import ViClimateDataUpdateCoordinator
-from .utils import beautify_name, is_feature_ignored
+from .utils import (
+    beautify_name,
+    get_template_candidates,
+    index_templates,
+    is_feature_ignored,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -57,7 +63,10 @@ SELECT_TEMPLATES = [
     },
 ]
 
+_SELECT_TEMPLATE_INDEX = index_templates(SELECT_TEMPLATES)
 
+
+@cache
 def _get_select_entity_description(
     feature_name: str,
 ) -> tuple[ViClimateSelectEntityDescription, dict[str, str] | None] | None:
@@ -66,7 +75,8 @@ def _get_select_entity_description(
     Returns:
         tuple: (description, translation_placeholders) or None
     """
-    for template in SELECT_TEMPLATES:
+    candidates = get_template_candidates(_SELECT_TEMPLATE_INDEX, feature_name)
+    for template in candidates:
         match = template["pattern"].match(feature_name)
         if match:
             index = match.group(1)
@@ -94,17 +104,20 @@ async def async_setup_entry(
 
     if coordinator.data:
         for map_key, device in coordinator.data.items():
+            # Only disable entities by default for thoroughly tested devices
+            is_tested = device.model_id in TESTED_DEVICES
             for feature in device.features:
                 # Skip ignored features early
-                if is_feature_ignored(feature.name, IGNORED_FEATURES):
+                if is_feature_ignored(
+                    feature.name, IGNORED_FEATURES, IGNORED_FEATURE_PATTERNS
+                ):
                     continue
 
                 if not feature.is_writable:
                     continue
 
                 # 1. Defined Entities
-                if feature.name in SELECT_TYPES:
-                    desc = SELECT_TYPES[feature.name]
+                if desc := SELECT_TYPES.get(feature.name):
                     entities.append(
                         ViClimateSelect(coordinator, map_key, feature.name, desc)
                     )
@@ -132,8 +145,6 @@ async def async_setup_entry(
                         name=beautify_name(feature.name),
                         entity_category=EntityCategory.CONFIG,
                     )
-                    # Only disable entities by default for thoroughly tested devices
-                    is_tested = device.model_id in TESTED_DEVICES
                     entities.append(
                         ViClimateSelect(
                             coordinator,
@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import dataclasses
 import re
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import cache
+from types import MappingProxyType
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -27,9 +30,18 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, IGNORED_FEATURES, TESTED_DEVICES
+from .const import DOMAIN, IGNORED_FEATURE_PATTERNS, IGNORED_FEATURES, TESTED_DEVICES
 from .coordinator import ViClimateDataUpdateCoordinator
-from .utils import beautify_name, is_feature_boolean_like, is_feature_ignored
+from .utils import (
+    beautify_name,
+    get_template_candidates,
+    index_templates,
+    is_feature_boolean_like,
+    is_feature_ignored,
+)
+
+# One mapping is shared by every sensor without placeholders, so it is read-only.
+_EMPTY_PLACEHOLDERS: Mapping[str, str] = MappingProxyType({})
 
 
 @dataclass
@@ -296,6 +308,8 @@ SENSOR_TEMPLATES = [
     },
 ]
 
+_SENSOR_TEMPLATE_INDEX = index_templates(SENSOR_TEMPLATES)
+
 SENSOR_TYPES: dict[str, SensorEntityDescription] = {
     # Boiler Common Supply Temperature
     "heating.boiler.sensors.temperature.commonSupply": SensorEntityDescription(
@@ -613,6 +627,7 @@ SENSOR_TYPES: dict[str, SensorEntityDescription] = {
 }
 
 
+@cache
 def _get_sensor_entity_description(
     feature_name: str,
 ) -> tuple[SensorEntityDescription, dict[str, str] | None] | None:
@@ -621,7 +636,8 @@ def _get_sensor_entity_description(
     Returns:
         tuple: (description, translation_placeholders) or None
     """
-    for template in SENSOR_TEMPLATES:
+    candidates = get_template_candidates(_SENSOR_TEMPLATE_INDEX, feature_name)
+    for template in candidates:
         match = template["pattern"].match(feature_name)
         if match:
             index = match.group(1)
@@ -714,15 +730,18 @@ def _discover_realtime_sensors(
     """Discover and return realtime sensor entities."""
     entities = []
     for map_key, device in coordinator.data.items():
+        # Only disable entities by default for thoroughly tested devices
+        is_tested = device.model_id in TESTED_DEVICES
         # Iterate over FLATTENED features
         for feature in device.features:
             # Skip ignored features early
-            if is_feature_ignored(feature.name, IGNORED_FEATURES):
+            if is_feature_ignored(
+                feature.name, IGNORED_FEATURES, IGNORED_FEATURE_PATTERNS
+            ):
                 continue
 
             # 1. Defined Entities (High Quality)
-            if feature.name in SENSOR_TYPES:
-                description = SENSOR_TYPES[feature.name]
+            if description := SENSOR_TYPES.get(feature.name):
                 entities.append(
                     ViClimateSensor(coordinator, map_key, feature.name, description)
                 )
@@ -746,8 +765,6 @@ def _discover_realtime_sensors(
             # (Binary Sensor platform handles all boolean-like values)
             if not feature.is_writable and not is_feature_boolean_like(feature.value):
                 description = _get_auto_discovery_description(feature)
-                # Only disable entities by default for thoroughly tested devices
-                is_tested = device.model_id in TESTED_DEVICES
                 entities.append(
                     ViClimateSensor(
                         coordinator,
@@ -777,7 +794,9 @@ class ViClimateSensor(CoordinatorEntity, SensorEntity):
         self.entity_description = description
         self._map_key = map_key
         self._feature_name = feature_name
-        self._attr_translation_placeholders = translation_placeholders or {}
+        self._attr_translation_placeholders = (
+            translation_placeholders or _EMPTY_PLACEHOLDERS
+        )
         self._attr_entity_registry_enabled_default = enabled_default
 
         device = coordinator.data.get(map_key)
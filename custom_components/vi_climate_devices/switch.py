@@ -20,7 +20,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from vi_api_client import Feature
 
-from .const import DOMAIN, IGNORED_FEATURES, TESTED_DEVICES
+from .const import DOMAIN, IGNORED_FEATURE_PATTERNS, IGNORED_FEATURES, TESTED_DEVICES
 from .coordinator import ViClimateDataUpdateCoordinator
 from .utils import (
     beautify_name,
@@ -70,14 +70,17 @@ async def async_setup_entry(
 
     if coordinator.data:
         for map_key, device in coordinator.data.items():
+            # Only disable entities by default for thoroughly tested devices
+            is_tested = device.model_id in TESTED_DEVICES
             for feature in device.features:
                 # Skip ignored features early
-                if is_feature_ignored(feature.name, IGNORED_FEATURES):
+                if is_feature_ignored(
+                    feature.name, IGNORED_FEATURES, IGNORED_FEATURE_PATTERNS
+                ):
                     continue
 
                 # 1. Defined Entities (Skip writable check for known overrides)
-                if feature.name in SWITCH_TYPES:
-                    desc = SWITCH_TYPES[feature.name]
+                if desc := SWITCH_TYPES.get(feature.name):
                     entities.append(
                         ViClimateSwitch(coordinator, map_key, feature.name, desc)
                     )
@@ -95,8 +98,6 @@ async def async_setup_entry(
                         name=beautify_name(feature.name),
                         entity_category=EntityCategory.CONFIG,
                     )
-                    # Only disable entities by default for thoroughly tested devices
-                    is_tested = device.model_id in TESTED_DEVICES
                     entities.append(
                         ViClimateSwitch(
                             coordinator,
@@ -137,6 +138,15 @@ class ViClimateSwitch(CoordinatorEntity, SwitchEntity):
         self._attr_unique_id = f"{device.gateway_serial}-{device.id}-{description.key}"
         self._attr_has_entity_name = True
 
+        # Device identity never changes for a map key, so build it once.
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{device.gateway_serial}-{device.id}")},
+            name=device.model_id,
+            manufacturer="Viessmann",
+            model=device.model_id,
+            serial_number=device.gateway_serial,
+        )
+
         # Improve name for auto-discovered entities
         if (
             not hasattr(description, "translation_key")
@@ -155,20 +165,6 @@ class ViClimateSwitch(CoordinatorEntity, SwitchEntity):
             return None
         return device.get_feature(self._feature_name)
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device = self.coordinator.data.get(self._map_key)
-        if not device:
-            return None
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{device.gateway_serial}-{device.id}")},
-            name=device.model_id,
-            manufacturer="Viessmann",
-            model=device.model_id,
-            serial_number=device.gateway_serial,
-        )
-
     @property
     def is_on(self) -> bool | None:
         """Return true if the switch is on."""
@@ -1,8 +1,17 @@
 """Shared utility functions for the Viessmann Climate Devices integration."""
 
+import heapq
 import re
+from collections.abc import Collection, Iterable
+from operator import itemgetter
 from typing import Any
 
+# Splits camelCase words by matching a lowercase letter followed by an uppercase.
+_CAMEL_CASE_BOUNDARY = re.compile(r"([a-z])([A-Z])")
+
+# Bucket for templates whose pattern does not start with a literal prefix.
+_ANY_PREFIX = ""
+
 
 def beautify_name(name: str) -> str:
     """Convert a dot-separated name to a Title Cased string.
@@ -42,7 +51,7 @@ def beautify_name(name: str) -> str:
 
     # Split camelCase: insert space before uppercase letters
     # that follow lowercase letters
-    name = re.sub(r"([a-z])([A-Z])", r"\1 \2", name)
+    name = _CAMEL_CASE_BOUNDARY.sub(r"\1 \2", name)
 
     return name.title()
 
@@ -91,15 +100,69 @@ def get_feature_bool_value(value: Any, strict: bool = False) -> bool | None:
 
 def is_feature_ignored(
     feature_name: str,
-    ignored_features: list[str | re.Pattern],
+    ignored_features: Collection[str],
+    ignored_patterns: Iterable[re.Pattern] = (),
 ) -> bool:
-    """Check if a feature should be ignored based on list of patterns."""
-    for pattern in ignored_features:
-        if isinstance(pattern, str) and feature_name == pattern:
-            return True
-        if hasattr(pattern, "match") and pattern.match(feature_name):
-            return True
-    return False
+    """Check if a feature should be ignored by exact name or regex pattern.
+
+    Exact names are checked with a single membership test before falling
+    back to the regex patterns.
+    """
+    if feature_name in ignored_features:
+        return True
+    return any(pattern.match(feature_name) for pattern in ignored_patterns)
+
+
+def _get_feature_prefix(feature_name: str) -> str:
+    """Return the first two dot-separated segments of a feature name."""
+    return ".".join(feature_name.split(".", 2)[:2])
+
+
+def get_template_prefix(pattern: re.Pattern) -> str:
+    """Return the literal two-segment prefix of an anchored template pattern.
+
+    Example: '^heating\\.circuits\\.(\\d+)\\.name$' -> 'heating.circuits'
+    Patterns without a plain literal prefix return an empty string.
+    """
+    segments = pattern.pattern.removeprefix("^").split(r"\.", 2)[:2]
+    if len(segments) < 2 or not all(segment.isalnum() for segment in segments):
+        return _ANY_PREFIX
+    return ".".join(segments)
+
+
+def index_templates(
+    templates: list[dict[str, Any]],
+) -> dict[str, list[tuple[int, dict[str, Any]]]]:
+    """Group entity templates by the literal prefix of their pattern.
+
+    Lookups then only try the patterns that can match a feature name. Each
+    template keeps its position in the list, because the first matching
+    template wins and the buckets must be merged back in that order.
+    """
+    index: dict[str, list[tuple[int, dict[str, Any]]]] = {}
+    for position, template in enumerate(templates):
+        prefix = get_template_prefix(template["pattern"])
+        index.setdefault(prefix, []).append((position, template))
+    return index
+
+
+def get_template_candidates(
+    index: dict[str, list[tuple[int, dict[str, Any]]]],
+    feature_name: str,
+) -> list[dict[str, Any]]:
+    """Return the indexed templates that can match a feature name, in order.
+
+    The platform lookups built on this are cached per feature name, so the
+    descriptions and placeholders they return are shared and must not be mutated.
+    """
+    return [
+        template
+        for _, template in heapq.merge(
+            index.get(_get_feature_prefix(feature_name), ()),
+            index.get(_ANY_PREFIX, ()),
+            key=itemgetter(0),
+        )
+    ]
 
 
 def get_suggested_precision(step: float | None) -> int | None:
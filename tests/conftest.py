@@ -1,7 +1,29 @@
+import copy
+from unittest.mock import patch
+
 import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 from pytest_homeassistant_custom_component.syrupy import HomeAssistantSnapshotExtension
 from vi_api_client.mock_client import MockViClient
 
+from custom_components.vi_climate_devices.const import DOMAIN
+
+# The OAuth2 implementation is only passed through to the patched session.
+_OAUTH_IMPLEMENTATION = object()
+
+# Config entry data for all integration tests. Each entry gets a deep copy so a
+# token refreshed in place cannot leak into later tests.
+MOCK_ENTRY_DATA = {
+    "client_id": "123",
+    "token": {
+        "access_token": "mock_access_token",
+        "refresh_token": "mock_refresh_token",
+        "expires_at": 3800000000,
+        "token_type": "Bearer",
+    },
+}
+
 
 @pytest.fixture
 def mock_client():
@@ -19,3 +41,47 @@ def auto_enable_custom_integrations(enable_custom_integrations):
 def snapshot(snapshot):
     """Override the snapshot fixture to force using the Home Assistant extension."""
     return snapshot.use_extension(HomeAssistantSnapshotExtension)
+
+
+@pytest.fixture
+def mock_oauth():
+    """Bypass the OAuth2 implementation lookup and the auth bridge.
+
+    MOCK_ENTRY_DATA carries a far-future expires_at, so token validation
+    returns without refreshing and does not need to be patched.
+    """
+    with (
+        patch(
+            "homeassistant.helpers.config_entry_oauth2_flow.async_get_config_entry_implementation",
+            return_value=_OAUTH_IMPLEMENTATION,
+        ),
+        patch("custom_components.vi_climate_devices.HAAuth"),
+    ):
+        yield
+
+
+@pytest.fixture
+def mock_config_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Return a config entry for the integration that is added to hass."""
+    entry = MockConfigEntry(domain=DOMAIN, data=copy.deepcopy(MOCK_ENTRY_DATA))
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+def setup_integration(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry, mock_oauth
+):
+    """Return a helper that sets up the integration with the provided client."""
+
+    async def _setup_integration(client) -> MockConfigEntry:
+        with patch(
+            "custom_components.vi_climate_devices.ViessmannClient",
+            return_value=client,
+        ):
+            await hass.config_entries.async_setup(mock_config_entry.entry_id)
+            await hass.async_block_till_done()
+
+        return mock_config_entry
+
+    return _setup_integration
@@ -1,6 +1,5 @@
 """Tests for application credentials helpers."""
 
-import pytest
 from homeassistant.components.application_credentials import ClientCredential
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.config_entry_oauth2_flow import (
@@ -14,7 +13,6 @@ from custom_components.vi_climate_devices.application_credentials import (
 )
 
 
-@pytest.mark.asyncio
 async def test_async_get_authorization_server_uses_viessmann_endpoints(
     hass: HomeAssistant,
 ) -> None:
@@ -29,7 +27,6 @@ async def test_async_get_authorization_server_uses_viessmann_endpoints(
     assert str(server.token_url) == ENDPOINT_TOKEN
 
 
-@pytest.mark.asyncio
 async def test_async_get_auth_implementation_returns_pkce_implementation(
     hass: HomeAssistant,
 ) -> None:
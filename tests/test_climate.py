@@ -23,7 +23,6 @@ from vi_api_client.models import CommandResponse, Device, Feature, FeatureContro
 from custom_components.vi_climate_devices.const import DOMAIN
 
 
-@pytest.mark.asyncio
 async def test_climate_creation_and_services(hass: HomeAssistant, mock_client) -> None:
     """Test climate entity creation, attributes, and service calls."""
     # Arrange: Mock Config Entry and setup integration.
@@ -88,12 +87,13 @@ async def test_climate_creation_and_services(hass: HomeAssistant, mock_client) -
         component = hass.data.get("climate")
         entity = component.get_entity(entity_id)
         assert entity.preset_mode == PRESET_HOME
-        assert sorted(entity.preset_modes) == sorted(
-            [PRESET_COMFORT, PRESET_ECO, PRESET_HOME, PRESET_SLEEP]
-        )
-        assert sorted(state.attributes["hvac_modes"]) == sorted(
-            [HVACMode.HEAT, HVACMode.OFF]
-        )
+        assert entity.preset_modes == [
+            PRESET_COMFORT,
+            PRESET_ECO,
+            PRESET_HOME,
+            PRESET_SLEEP,
+        ]
+        assert state.attributes["hvac_modes"] == [HVACMode.HEAT, HVACMode.OFF]
         assert state.attributes["active_program"] == "normalHeating"
         assert state.attributes["heating_curve_slope"] == 0.6
         assert state.attributes["heating_curve_shift"] == 4.0
@@ -148,7 +148,6 @@ async def test_climate_creation_and_services(hass: HomeAssistant, mock_client) -
         await hass.async_block_till_done()
 
 
-@pytest.mark.asyncio
 async def test_climate_error_handling_and_rollback(
     hass: HomeAssistant, mock_client
 ) -> None:
@@ -201,7 +200,6 @@ async def test_climate_error_handling_and_rollback(
         await hass.async_block_till_done()
 
 
-@pytest.mark.asyncio
 async def test_climate_program_matching_variations(
     hass: HomeAssistant, mock_client
 ) -> None:
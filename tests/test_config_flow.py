@@ -3,7 +3,6 @@
 from typing import Any
 from unittest.mock import patch
 
-import pytest
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
@@ -41,7 +40,6 @@ class FakeOAuthImplementation(config_entry_oauth2_flow.AbstractOAuth2Implementat
         return token
 
 
-@pytest.mark.asyncio
 async def test_flow_handler_exposes_viessmann_scope() -> None:
     """Test the flow handler appends the Viessmann OAuth scopes to the authorize URL."""
     # Arrange: Instantiate the lightweight OAuth flow wrapper.
@@ -54,7 +52,6 @@ async def test_flow_handler_exposes_viessmann_scope() -> None:
     assert authorize_data == {"scope": DEFAULT_SCOPES}
 
 
-@pytest.mark.asyncio
 async def test_user_flow_shows_picker_and_starts_external_step(
     hass: HomeAssistant,
 ) -> None:
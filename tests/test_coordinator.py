@@ -40,7 +40,6 @@ def _build_device(
     )
 
 
-@pytest.mark.asyncio
 async def test_data_coordinator_raises_when_no_installations_exist(
     hass: HomeAssistant, mock_client
 ) -> None:
@@ -54,7 +53,6 @@ async def test_data_coordinator_raises_when_no_installations_exist(
         await coordinator._async_update_data()
 
 
-@pytest.mark.asyncio
 async def test_data_coordinator_discovers_devices_and_filters_ignored_ids(
     hass: HomeAssistant, mock_client
 ) -> None:
@@ -83,7 +81,6 @@ async def test_data_coordinator_discovers_devices_and_filters_ignored_ids(
     assert coordinator._known_devices == [active_device]
 
 
-@pytest.mark.asyncio
 async def test_data_coordinator_keeps_last_device_state_when_refresh_fails(
     hass: HomeAssistant, mock_client
 ) -> None:
@@ -102,7 +99,6 @@ async def test_data_coordinator_keeps_last_device_state_when_refresh_fails(
     assert coordinator._known_devices == [known_device]
 
 
-@pytest.mark.asyncio
 async def test_data_coordinator_raises_reauth_when_device_update_loses_auth(
     hass: HomeAssistant, mock_client
 ) -> None:
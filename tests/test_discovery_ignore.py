@@ -1,51 +1,13 @@
 """Test discovery ignore list functionality."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
-import pytest
 from homeassistant.core import HomeAssistant
-from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.vi_climate_devices.const import DOMAIN
 
-
-async def _setup_integration(hass: HomeAssistant, mock_client):
-    """Helper to setup the integration with the provided mock client."""
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        data={
-            "client_id": "123",
-            "token": {
-                "access_token": "mock_access_token",
-                "refresh_token": "mock_refresh_token",
-                "expires_at": 3800000000,
-                "token_type": "Bearer",
-            },
-        },
-    )
-    entry.add_to_hass(hass)
-
-    with (
-        patch(
-            "custom_components.vi_climate_devices.ViessmannClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "homeassistant.helpers.config_entry_oauth2_flow.async_get_config_entry_implementation",
-            return_value=MagicMock(),
-        ),
-        patch(
-            "homeassistant.helpers.config_entry_oauth2_flow.OAuth2Session.async_ensure_token_valid",
-            return_value=None,
-        ),
-        patch("custom_components.vi_climate_devices.HAAuth"),
-    ):
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
-
-
-@pytest.mark.asyncio
-async def test_auto_discovery_ignore_list(hass: HomeAssistant, mock_client):
+async def test_auto_discovery_ignore_list(
+    hass: HomeAssistant, mock_client, setup_integration
+):
     """Test that features in IGNORED_FEATURES are not created as entities."""
     # Arrange: Use mock_client fixture
     # We want to ignore a specific feature that would normally be discovered.
@@ -64,7 +26,7 @@ async def test_auto_discovery_ignore_list(hass: HomeAssistant, mock_client):
         ),
     ):
         # Act: Initialize the integration (setup entry)
-        await _setup_integration(hass, mock_client)
+        await setup_integration(mock_client)
 
         # Assert: Verify the 'outside value' sensor is NOT created.
         # Standard entity name would be sensor.vitocal250a_outside_temperature
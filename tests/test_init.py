@@ -31,7 +31,6 @@ def _build_entry() -> MockConfigEntry:
     )
 
 
-@pytest.mark.asyncio
 async def test_async_setup_entry_returns_false_when_token_validation_fails(
     hass: HomeAssistant,
 ) -> None:
@@ -58,7 +57,6 @@ async def test_async_setup_entry_returns_false_when_token_validation_fails(
     assert hass.data[DOMAIN] == {}
 
 
-@pytest.mark.asyncio
 async def test_async_setup_entry_stores_only_main_coordinator(
     hass: HomeAssistant,
 ) -> None:
@@ -110,14 +108,13 @@ async def test_async_setup_entry_stores_only_main_coordinator(
     forward_entry_setups.assert_awaited_once_with(entry, PLATFORMS)
 
 
-@pytest.mark.asyncio
 async def test_async_unload_entry_removes_runtime_data_after_platform_unload(
     hass: HomeAssistant,
 ) -> None:
     """Test unloading removes stored runtime data when platform unload succeeds."""
     # Arrange: Seed runtime data and make platform unload succeed.
     entry = _build_entry()
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {"data": MagicMock()}
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {"data": object()}
     unload_platforms = AsyncMock(return_value=True)
 
     with patch.object(hass.config_entries, "async_unload_platforms", unload_platforms):
@@ -130,14 +127,13 @@ async def test_async_unload_entry_removes_runtime_data_after_platform_unload(
     unload_platforms.assert_awaited_once_with(entry, PLATFORMS)
 
 
-@pytest.mark.asyncio
 async def test_async_unload_entry_keeps_runtime_data_when_platform_unload_fails(
     hass: HomeAssistant,
 ) -> None:
     """Test unloading keeps runtime data intact when platform unload fails."""
     # Arrange: Seed runtime data and make platform unload fail.
     entry = _build_entry()
-    runtime_data = {"data": MagicMock()}
+    runtime_data = {"data": object()}
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = runtime_data
     unload_platforms = AsyncMock(return_value=False)
 
@@ -151,7 +147,6 @@ async def test_async_unload_entry_keeps_runtime_data_when_platform_unload_fails(
     unload_platforms.assert_awaited_once_with(entry, PLATFORMS)
 
 
-@pytest.mark.asyncio
 async def test_haauth_async_get_access_token_returns_refreshed_token(
     hass: HomeAssistant,
 ) -> None:
@@ -178,7 +173,6 @@ async def test_haauth_async_get_access_token_returns_refreshed_token(
     oauth_session.async_ensure_token_valid.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_haauth_async_get_access_token_wraps_refresh_errors(
     hass: HomeAssistant,
 ) -> None:
@@ -1,6 +1,6 @@
 """Tests for the Viessmann Heat number platform."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock
 
 import pytest
 from homeassistant.components.number import (
@@ -11,31 +11,15 @@ from homeassistant.components.number import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
-from pytest_homeassistant_custom_component.common import MockConfigEntry
 from vi_api_client.models import CommandResponse
 
-from custom_components.vi_climate_devices.const import DOMAIN
 
-
-@pytest.mark.asyncio
-async def test_number_creation_and_services(hass: HomeAssistant, mock_client):
+async def test_number_creation_and_services(
+    hass: HomeAssistant, mock_client, setup_integration
+):
     """Test number entity creation, values, and service calls."""
-    # Arrange: Mock Config Entry.
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        data={
-            "client_id": "123",
-            "token": {
-                "access_token": "mock_access_token",
-                "refresh_token": "mock_refresh_token",
-                "expires_at": 3800000000,
-                "token_type": "Bearer",
-            },
-        },
-    )
-    entry.add_to_hass(hass)
 
-    # Spy on set_feature to verify service calls (returns tuple in v1.0.0).
+    # Arrange: Spy on set_feature to verify service calls (returns tuple in v1.0.0).
     async def mock_set_feature(device, feature, value):
         response = CommandResponse(
             success=True, message=None, reason="COMMAND_EXECUTION_SUCCESS"
@@ -44,174 +28,125 @@ async def test_number_creation_and_services(hass: HomeAssistant, mock_client):
 
     mock_client.set_feature = AsyncMock(side_effect=mock_set_feature)
 
-    with (
-        patch(
-            "custom_components.vi_climate_devices.ViessmannClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "homeassistant.helpers.config_entry_oauth2_flow.async_get_config_entry_implementation",
-            return_value=MagicMock(),
-        ),
-        patch(
-            "homeassistant.helpers.config_entry_oauth2_flow.OAuth2Session.async_ensure_token_valid",
-            return_value=None,
-        ),
-        patch("custom_components.vi_climate_devices.HAAuth"),
-    ):
-        # Act: Load Integration.
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
-
-        # Test 1: Heating Curve Slope (Regex/Template Entity).
-
-        # Verify initial state and attributes from fixture.
-        # Fixture: Value=0.6, Min=0.2, Max=3.5, Step=0.1.
-        slope = hass.states.get("number.vitocal250a_heating_circuit_0_curve_slope")
-        assert slope is not None
-        assert slope.state == "0.6"
-        assert slope.attributes[ATTR_MIN] == 0.2
-        assert slope.attributes[ATTR_MAX] == 3.5
-        assert slope.attributes[ATTR_STEP] == 0.1
-
-        # Verify precision on entity
-        component = hass.data.get("number")
-        entity_id = "number.vitocal250a_heating_circuit_0_curve_slope"
-        entity = component.get_entity(entity_id)
-        assert entity.suggested_display_precision == 1
-
-        # Act: Set slope to 1.6.
-        await hass.services.async_call(
-            "number",
-            SERVICE_SET_VALUE,
-            {
-                "entity_id": "number.vitocal250a_heating_circuit_0_curve_slope",
-                "value": 1.6,
-            },
-            blocking=True,
-        )
+    # Act: Load Integration.
+    entry = await setup_integration(mock_client)
+
+    # Test 1: Heating Curve Slope (Regex/Template Entity).
+
+    # Verify initial state and attributes from fixture.
+    # Fixture: Value=0.6, Min=0.2, Max=3.5, Step=0.1.
+    slope = hass.states.get("number.vitocal250a_heating_circuit_0_curve_slope")
+    assert slope is not None
+    assert slope.state == "0.6"
+    assert slope.attributes[ATTR_MIN] == 0.2
+    assert slope.attributes[ATTR_MAX] == 3.5
+    assert slope.attributes[ATTR_STEP] == 0.1
+
+    # Verify precision on entity
+    component = hass.data.get("number")
+    entity_id = "number.vitocal250a_heating_circuit_0_curve_slope"
+    entity = component.get_entity(entity_id)
+    assert entity.suggested_display_precision == 1
+
+    # Act: Set slope to 1.6.
+    await hass.services.async_call(
+        "number",
+        SERVICE_SET_VALUE,
+        {
+            "entity_id": "number.vitocal250a_heating_circuit_0_curve_slope",
+            "value": 1.6,
+        },
+        blocking=True,
+    )
+
+    # Verify Service Call.
+    assert mock_client.set_feature.call_count == 1
+    args, _ = mock_client.set_feature.call_args
+    assert args[1].name == "heating.circuits.0.heating.curve.slope"
+    assert args[2] == 1.6
+
+    # Verify Optimistic Update (Option A).
+    # State should update immediately to 1.6.
+    slope = hass.states.get("number.vitocal250a_heating_circuit_0_curve_slope")
+    assert slope.state == "1.6"
+
+    # Test 2: DHW Target Temperature (Standard Entity).
+
+    # Verify initial state (Fixture has 55.0).
+    dhw_temp = hass.states.get("number.vitocal250a_dhw_target_temperature")
+    assert dhw_temp is not None
+    assert float(dhw_temp.state) == 55.0
+    assert dhw_temp.attributes[ATTR_MIN] == 10.0
+    assert dhw_temp.attributes[ATTR_MAX] == 60.0
+
+    # Reset Mock.
+    mock_client.set_feature.reset_mock()
+
+    # Act: Set DHW Temp to 45.0.
+    await hass.services.async_call(
+        "number",
+        SERVICE_SET_VALUE,
+        {"entity_id": "number.vitocal250a_dhw_target_temperature", "value": 45.0},
+        blocking=True,
+    )
+
+    # Verify Service Call.
+    assert mock_client.set_feature.call_count == 1
+    args, _ = mock_client.set_feature.call_args
+    assert args[1].name == "heating.dhw.temperature.main"
+    assert args[2] == 45.0
+
+    # Verify Optimistic Update.
+    dhw_temp = hass.states.get("number.vitocal250a_dhw_target_temperature")
+    assert float(dhw_temp.state) == 45.0
+
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
 
-        # Verify Service Call.
-        assert mock_client.set_feature.call_count == 1
-        args, _ = mock_client.set_feature.call_args
-        assert args[1].name == "heating.circuits.0.heating.curve.slope"
-        assert args[2] == 1.6
+async def test_number_error_handling(
+    hass: HomeAssistant, mock_client, setup_integration
+):
+    """Test number entity error handling and rollback (Option B)."""
 
-        # Verify Optimistic Update (Option A).
-        # State should update immediately to 1.6.
-        slope = hass.states.get("number.vitocal250a_heating_circuit_0_curve_slope")
-        assert slope.state == "1.6"
+    # Arrange: Simulate an API error.
+    async def mock_set_feature_error(device, feature, value):
+        raise HomeAssistantError("API Error")
 
-        # Test 2: DHW Target Temperature (Standard Entity).
+    mock_client.set_feature = AsyncMock(side_effect=mock_set_feature_error)
 
-        # Verify initial state (Fixture has 55.0).
-        dhw_temp = hass.states.get("number.vitocal250a_dhw_target_temperature")
-        assert dhw_temp is not None
-        assert float(dhw_temp.state) == 55.0
-        assert dhw_temp.attributes[ATTR_MIN] == 10.0
-        assert dhw_temp.attributes[ATTR_MAX] == 60.0
+    # Act: Initialize integration.
+    entry = await setup_integration(mock_client)
 
-        # Reset Mock.
-        mock_client.set_feature.reset_mock()
+    # Check Initial State.
+    entity_id = "number.vitocal250a_heating_circuit_0_curve_slope"
+    state = hass.states.get(entity_id)
+    assert state.state == "0.6"
 
-        # Act: Set DHW Temp to 45.0.
+    # Act: Try to set value to 2.0 (Should fail).
+    with pytest.raises(HomeAssistantError):
         await hass.services.async_call(
             "number",
             SERVICE_SET_VALUE,
-            {"entity_id": "number.vitocal250a_dhw_target_temperature", "value": 45.0},
+            {"entity_id": entity_id, "value": 2.0},
             blocking=True,
         )
 
-        # Verify Service Call.
-        assert mock_client.set_feature.call_count == 1
-        args, _ = mock_client.set_feature.call_args
-        assert args[1].name == "heating.dhw.temperature.main"
-        assert args[2] == 45.0
-
-        # Verify Optimistic Update.
-        dhw_temp = hass.states.get("number.vitocal250a_dhw_target_temperature")
-        assert float(dhw_temp.state) == 45.0
+    # Assert: Rollback occurred.
+    # State should still be 0.6, not 2.0.
+    state = hass.states.get(entity_id)
+    assert state.state == "0.6"
 
-        await hass.config_entries.async_unload(entry.entry_id)
-        await hass.async_block_till_done()
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
 
 
-@pytest.mark.asyncio
-async def test_number_error_handling(hass: HomeAssistant, mock_client):
-    """Test number entity error handling and rollback (Option B)."""
-    # Arrange: Setup integration with mock client.
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        data={
-            "client_id": "123",
-            "token": {"access_token": "mock", "expires_at": 9999999999},
-        },
-    )
-    entry.add_to_hass(hass)
-
-    # Simulate API Error.
-    async def mock_set_feature_error(device, feature, value):
-        raise HomeAssistantError("API Error")
-
-    mock_client.set_feature = AsyncMock(side_effect=mock_set_feature_error)
-
-    with (
-        patch(
-            "custom_components.vi_climate_devices.ViessmannClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "homeassistant.helpers.config_entry_oauth2_flow.async_get_config_entry_implementation",
-            return_value=MagicMock(),
-        ),
-        patch(
-            "homeassistant.helpers.config_entry_oauth2_flow.OAuth2Session.async_ensure_token_valid",
-            return_value=None,
-        ),
-        patch("custom_components.vi_climate_devices.HAAuth"),
-    ):
-        # Act: Initialize integration.
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
-
-        # Check Initial State.
-        entity_id = "number.vitocal250a_heating_circuit_0_curve_slope"
-        state = hass.states.get(entity_id)
-        assert state.state == "0.6"
-
-        # Act: Try to set value to 2.0 (Should fail).
-        with pytest.raises(HomeAssistantError):
-            await hass.services.async_call(
-                "number",
-                SERVICE_SET_VALUE,
-                {"entity_id": entity_id, "value": 2.0},
-                blocking=True,
-            )
-
-        # Assert: Rollback occurred.
-        # State should still be 0.6, not 2.0.
-        state = hass.states.get(entity_id)
-        assert state.state == "0.6"
-
-        await hass.config_entries.async_unload(entry.entry_id)
-        await hass.async_block_till_done()
-
-
-@pytest.mark.asyncio
-async def test_number_api_rejection(hass: HomeAssistant, mock_client):
+async def test_number_api_rejection(
+    hass: HomeAssistant, mock_client, setup_integration
+):
     """Test number handling of API logical rejection (success=False)."""
-    # Arrange: Setup integration.
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        data={
-            "client_id": "123",
-            "token": {"access_token": "mock", "expires_at": 9999999999},
-        },
-    )
-    entry.add_to_hass(hass)
-
-    # Simulate API Logical Failure.
 
+    # Arrange: Simulate an API logical failure.
     async def mock_set_feature_rejection(device, feature, value):
         response = CommandResponse(
             success=False, message="Parameter out of range", reason=None
@@ -220,67 +155,37 @@ async def test_number_api_rejection(hass: HomeAssistant, mock_client):
 
     mock_client.set_feature = AsyncMock(side_effect=mock_set_feature_rejection)
 
-    with (
-        patch(
-            "custom_components.vi_climate_devices.ViessmannClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "homeassistant.helpers.config_entry_oauth2_flow.async_get_config_entry_implementation",
-            return_value=MagicMock(),
-        ),
-        patch(
-            "homeassistant.helpers.config_entry_oauth2_flow.OAuth2Session.async_ensure_token_valid",
-            return_value=None,
-        ),
-        patch("custom_components.vi_climate_devices.HAAuth"),
+    # Act: Initialize.
+    entry = await setup_integration(mock_client)
+
+    entity_id = "number.vitocal250a_heating_circuit_0_curve_slope"
+    state = hass.states.get(entity_id)
+    original_state = state.state  # "0.6"
+
+    # Act: Try to set value.
+    with pytest.raises(
+        HomeAssistantError, match="Command rejected: Parameter out of range"
     ):
-        # Act: Initialize.
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
-
-        entity_id = "number.vitocal250a_heating_circuit_0_curve_slope"
-        state = hass.states.get(entity_id)
-        original_state = state.state  # "0.6"
-
-        # Act: Try to set value.
-        with pytest.raises(
-            HomeAssistantError, match="Command rejected: Parameter out of range"
-        ):
-            await hass.services.async_call(
-                "number",
-                SERVICE_SET_VALUE,
-                {"entity_id": entity_id, "value": 2.0},
-                blocking=True,
-            )
-
-        # Assert: Rollback occurred.
-        state = hass.states.get(entity_id)
-        assert state.state == original_state
-
-        await hass.config_entries.async_unload(entry.entry_id)
-        await hass.async_block_till_done()
-
-
-@pytest.mark.asyncio
-async def test_number_floating_point_precision(hass: HomeAssistant, mock_client):
-    """Test number entity rounds floating-point values before API calls."""
-    # Arrange: Setup integration with mock client that records exact values sent.
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        data={
-            "client_id": "123",
-            "token": {
-                "access_token": "mock_access_token",
-                "refresh_token": "mock_refresh_token",
-                "expires_at": 3800000000,
-                "token_type": "Bearer",
-            },
-        },
-    )
-    entry.add_to_hass(hass)
+        await hass.services.async_call(
+            "number",
+            SERVICE_SET_VALUE,
+            {"entity_id": entity_id, "value": 2.0},
+            blocking=True,
+        )
+
+    # Assert: Rollback occurred.
+    state = hass.states.get(entity_id)
+    assert state.state == original_state
+
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
 
-    # Track the actual values sent to the API.
+
+async def test_number_floating_point_precision(
+    hass: HomeAssistant, mock_client, setup_integration
+):
+    """Test number entity rounds floating-point values before API calls."""
+    # Arrange: Track the actual values sent to the API.
     api_calls = []
 
     async def mock_set_feature(device, feature, value):
@@ -292,62 +197,46 @@ async def test_number_floating_point_precision(hass: HomeAssistant, mock_client)
 
     mock_client.set_feature = AsyncMock(side_effect=mock_set_feature)
 
-    with (
-        patch(
-            "custom_components.vi_climate_devices.ViessmannClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "homeassistant.helpers.config_entry_oauth2_flow.async_get_config_entry_implementation",
-            return_value=MagicMock(),
-        ),
-        patch(
-            "homeassistant.helpers.config_entry_oauth2_flow.OAuth2Session.async_ensure_token_valid",
-            return_value=None,
-        ),
-        patch("custom_components.vi_climate_devices.HAAuth"),
-    ):
-        # Act: Load Integration.
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
-
-        # Test Case 1: Heating Curve Slope with step=0.1 (precision=1).
-        # Send value with floating-point noise: 0.7000000000000001.
-        # Expected API call: 0.7 (rounded to 1 decimal place).
-        await hass.services.async_call(
-            "number",
-            SERVICE_SET_VALUE,
-            {
-                "entity_id": "number.vitocal250a_heating_circuit_0_curve_slope",
-                "value": 0.7000000000000001,
-            },
-            blocking=True,
-        )
-
-        # Assert: API received clean value 0.7.
-        assert len(api_calls) == 1
-        assert api_calls[0]["feature"] == "heating.circuits.0.heating.curve.slope"
-        assert api_calls[0]["value"] == 0.7
-
-        # Test Case 2: DHW Temperature with step=1.0 (precision=0).
-        # Send value with floating-point noise: 45.00000000001.
-        # Expected API call: 45.0 (rounded to 0 decimal places).
-        api_calls.clear()
+    # Act: Load Integration.
+    entry = await setup_integration(mock_client)
+
+    # Test Case 1: Heating Curve Slope with step=0.1 (precision=1).
+    # Send value with floating-point noise: 0.7000000000000001.
+    # Expected API call: 0.7 (rounded to 1 decimal place).
+    await hass.services.async_call(
+        "number",
+        SERVICE_SET_VALUE,
+        {
+            "entity_id": "number.vitocal250a_heating_circuit_0_curve_slope",
+            "value": 0.7000000000000001,
+        },
+        blocking=True,
+    )
 
-        await hass.services.async_call(
-            "number",
-            SERVICE_SET_VALUE,
-            {
-                "entity_id": "number.vitocal250a_dhw_target_temperature",
-                "value": 45.00000000001,
-            },
-            blocking=True,
-        )
+    # Assert: API received clean value 0.7.
+    assert len(api_calls) == 1
+    assert api_calls[0]["feature"] == "heating.circuits.0.heating.curve.slope"
+    assert api_calls[0]["value"] == 0.7
+
+    # Test Case 2: DHW Temperature with step=1.0 (precision=0).
+    # Send value with floating-point noise: 45.00000000001.
+    # Expected API call: 45.0 (rounded to 0 decimal places).
+    api_calls.clear()
+
+    await hass.services.async_call(
+        "number",
+        SERVICE_SET_VALUE,
+        {
+            "entity_id": "number.vitocal250a_dhw_target_temperature",
+            "value": 45.00000000001,
+        },
+        blocking=True,
+    )
 
-        # Assert: API received clean value 45.0.
-        assert len(api_calls) == 1
-        assert api_calls[0]["feature"] == "heating.dhw.temperature.main"
-        assert api_calls[0]["value"] == 45.0
+    # Assert: API received clean value 45.0.
+    assert len(api_calls) == 1
+    assert api_calls[0]["feature"] == "heating.dhw.temperature.main"
+    assert api_calls[0]["value"] == 45.0
 
-        await hass.config_entries.async_unload(entry.entry_id)
-        await hass.async_block_till_done()
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
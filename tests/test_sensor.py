@@ -1,56 +1,83 @@
 """Tests for the Viessmann Heat sensor platform."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
-import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
-from pytest_homeassistant_custom_component.common import MockConfigEntry
 from vi_api_client import Device, Feature
 
-from custom_components.vi_climate_devices.const import DOMAIN
-
-
-async def _setup_integration(hass: HomeAssistant, mock_client):
-    """Helper to setup the integration with the provided mock client."""
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        data={
-            "client_id": "123",
-            "token": {
-                "access_token": "mock_access_token",
-                "refresh_token": "mock_refresh_token",
-                "expires_at": 3800000000,
-                "token_type": "Bearer",
-            },
-        },
-    )
-    entry.add_to_hass(hass)
-
-    with (
-        patch(
-            "custom_components.vi_climate_devices.ViessmannClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "homeassistant.helpers.config_entry_oauth2_flow.async_get_config_entry_implementation",
-            return_value=MagicMock(),
-        ),
-        patch(
-            "homeassistant.helpers.config_entry_oauth2_flow.OAuth2Session.async_ensure_token_valid",
-            return_value=None,
-        ),
-        patch("custom_components.vi_climate_devices.HAAuth"),
-    ):
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
-
-
-@pytest.mark.asyncio
-async def test_sensor_values(hass: HomeAssistant, mock_client):
+# Auto-discovered features with specific units that are NOT in SENSOR_TYPES.
+_FEATURE_CELSIUS = Feature(
+    name="test.unknown.temp",
+    value=20.5,
+    is_enabled=True,
+    is_ready=True,
+    unit="celsius",
+)
+
+_FEATURE_BAR = Feature(
+    name="test.unknown.pressure",
+    value=1.5,
+    is_enabled=True,
+    is_ready=True,
+    unit="bar",
+)
+
+_FEATURE_ENERGY = Feature(
+    name="test.unknown.energy",
+    value=100.0,
+    is_enabled=True,
+    is_ready=True,
+    unit="kilowattHour",
+)
+
+_FEATURE_WATTHOUR = Feature(
+    name="test.unknown.watthour",
+    value=500.0,
+    is_enabled=True,
+    is_ready=True,
+    unit="wattHour",
+)
+
+_FEATURE_AMPERE = Feature(
+    name="test.unknown.ampere",
+    value=5.0,
+    is_enabled=True,
+    is_ready=True,
+    unit="ampere",
+)
+
+_FEATURE_FLOW = Feature(
+    name="test.unknown.flow",
+    value=500,
+    is_enabled=True,
+    is_ready=True,
+    unit="liter/hour",
+)
+
+# Devices are immutable, so one instance can back every setup.
+_UNIT_MAPPING_DEVICE = Device(
+    id="0",
+    gateway_serial="mock_gateway",
+    installation_id=123,
+    features=[
+        _FEATURE_CELSIUS,
+        _FEATURE_BAR,
+        _FEATURE_ENERGY,
+        _FEATURE_WATTHOUR,
+        _FEATURE_AMPERE,
+        _FEATURE_FLOW,
+    ],
+    model_id="MockDevice",
+    device_type="heating",
+    status="online",
+)
+
+
+async def test_sensor_values(hass: HomeAssistant, mock_client, setup_integration):
     """Test that sensors are created correctly from the fixture data."""
     # Act: Setup the integration with the global mock_client (Vitocal250A).
-    await _setup_integration(hass, mock_client)
+    entry = await setup_integration(mock_client)
 
     # Assert: Verify a Standard Sensor (Outside Temperature).
     # Fixture value is 12.2 -> State '12.2'.
@@ -69,15 +96,15 @@ async def test_sensor_values(hass: HomeAssistant, mock_client):
     )
 
     # Cleanup: Unload the integration to prevent thread leaks.
-    entry = hass.config_entries.async_entries(DOMAIN)[0]
     await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
 
 
-@pytest.mark.asyncio
-async def test_no_duplicate_entity_creation(hass: HomeAssistant, mock_client):
+async def test_no_duplicate_entity_creation(
+    hass: HomeAssistant, mock_client, setup_integration
+):
     """Ensure entities defined in SENSOR_TYPES or SENSOR_TEMPLATES are not also created as generic fallback sensors."""
-    await _setup_integration(hass, mock_client)
+    entry = await setup_integration(mock_client)
 
     # Assert: Verify duplicate prevention for Defined Features.
     # The specific entity 'outside_temperature' should exist, but the generic fallback 'heating_sensors_...' should not.
@@ -92,19 +119,20 @@ async def test_no_duplicate_entity_creation(hass: HomeAssistant, mock_client):
         is None
     )
 
+    # Assert: 'heating.dhw.status' ("on") is picked up by binary_sensor, NOT sensor.
+    assert hass.states.get("sensor.vitocal250a_heating_dhw_status") is None
+
     # Cleanup: Unload the integration to prevent thread leaks.
-    entry = hass.config_entries.async_entries(DOMAIN)[0]
     await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
 
 
-@pytest.mark.asyncio
 async def test_removed_today_energy_sensors_are_not_created(
-    hass: HomeAssistant, mock_client
+    hass: HomeAssistant, mock_client, setup_integration
 ):
     """Test removed today energy sensors are no longer created."""
     # Arrange: Set up the integration with the Vitocal250A fixture.
-    await _setup_integration(hass, mock_client)
+    entry = await setup_integration(mock_client)
 
     # Assert: The removed today sensors are absent after setup.
     assert hass.states.get("sensor.vitocal250a_dhw_consumption_today") is None
@@ -116,93 +144,25 @@ async def test_removed_today_energy_sensors_are_not_created(
     assert hass.states.get("sensor.vitocal250a_production_heating_current_day") is None
 
     # Cleanup: Unload the integration to prevent thread leaks.
-    entry = hass.config_entries.async_entries(DOMAIN)[0]
     await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
 
 
-@pytest.mark.asyncio
-async def test_auto_discovery_unit_mapping(hass: HomeAssistant, mock_client):
+async def test_auto_discovery_unit_mapping(
+    hass: HomeAssistant, mock_client, setup_integration
+):
     """Test that auto-discovered sensors get correct unit mapping based on feature.unit."""
-    # Arrange: Create a mock device with features that have specific units but are NOT in SENSOR_TYPES.
-
-    # Create Features with various units
-    feat_celsius = Feature(
-        name="test.unknown.temp",
-        value=20.5,
-        is_enabled=True,
-        is_ready=True,
-        unit="celsius",
-    )
-
-    feat_bar = Feature(
-        name="test.unknown.pressure",
-        value=1.5,
-        is_enabled=True,
-        is_ready=True,
-        unit="bar",
-    )
-
-    feat_energy = Feature(
-        name="test.unknown.energy",
-        value=100.0,
-        is_enabled=True,
-        is_ready=True,
-        unit="kilowattHour",
-    )
-
-    feat_watthour = Feature(
-        name="test.unknown.watthour",
-        value=500.0,
-        is_enabled=True,
-        is_ready=True,
-        unit="wattHour",
-    )
-
-    feat_ampere = Feature(
-        name="test.unknown.ampere",
-        value=5.0,
-        is_enabled=True,
-        is_ready=True,
-        unit="ampere",
-    )
-
-    feat_flow = Feature(
-        name="test.unknown.flow",
-        value=500,
-        is_enabled=True,
-        is_ready=True,
-        unit="liter/hour",
-    )
-
-    # Create Device
-    mock_device = Device(
-        id="0",
-        gateway_serial="mock_gateway",
-        installation_id=123,
-        features=[
-            feat_celsius,
-            feat_bar,
-            feat_energy,
-            feat_watthour,
-            feat_ampere,
-            feat_flow,
-        ],
-        model_id="MockDevice",
-        device_type="heating",
-        status="online",
-    )
-
-    # Arrange: Patch the mock client to return our custom device.
-
+    # Arrange: Patch the mock client to return the unit mapping device.
     with (
         patch.object(
-            mock_client, "get_full_installation_status", return_value=[mock_device]
+            mock_client,
+            "get_full_installation_status",
+            return_value=[_UNIT_MAPPING_DEVICE],
         ),
-        patch.object(mock_client, "update_device", return_value=mock_device),
+        patch.object(mock_client, "update_device", return_value=_UNIT_MAPPING_DEVICE),
     ):
         # Act
-        await _setup_integration(hass, mock_client)
+        entry = await setup_integration(mock_client)
 
         registry = er.async_get(hass)
 
@@ -243,46 +203,6 @@ async def test_auto_discovery_unit_mapping(hass: HomeAssistant, mock_client):
         assert entry_flow.disabled_by is None
         # Flow doesn't have a default device class in our auto-discovery yet
 
-        # Cleanup: Unload the integration to prevent thread leaks.
-        entry = hass.config_entries.async_entries(DOMAIN)[0]
-        await hass.config_entries.async_unload(entry.entry_id)
-        await hass.async_block_till_done()
-
-
-@pytest.mark.asyncio
-async def test_sensor_ignores_generic_on_off_string(hass: HomeAssistant, mock_client):
-    """Test that a feature with 'on'/'off' string value is NOT created as a sensor.
-
-    Using real fixture key: heating.dhw.status (value: "on")
-    """
-    # Arrange: Configure the integration with the mock client fixture.
-    with (
-        patch(
-            "custom_components.vi_climate_devices.ViessmannClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "homeassistant.helpers.config_entry_oauth2_flow.async_get_config_entry_implementation",
-            return_value=MagicMock(),
-        ),
-        patch(
-            "homeassistant.helpers.config_entry_oauth2_flow.OAuth2Session.async_ensure_token_valid",
-            return_value=None,
-        ),
-        patch("custom_components.vi_climate_devices.HAAuth"),
-    ):
-        entry = MockConfigEntry(domain=DOMAIN, data={"client_id": "1", "token": "x"})
-        entry.add_to_hass(hass)
-
-        # Act: Initialize the integration to trigger discovery.
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
-
-        # Assert: Sensor should NOT exist for 'heating.dhw.status'.
-        # The feature returns "on", so it should be picked up by binary_sensor, NOT sensor.
-        sensor_entity = hass.states.get("sensor.vitocal250a_heating_dhw_status")
-        assert sensor_entity is None
-
         # Cleanup: Unload the integration to prevent thread leaks.
         await hass.config_entries.async_unload(entry.entry_id)
         await hass.async_block_till_done()
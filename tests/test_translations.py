@@ -1,9 +1,9 @@
 """Tests for translation keys in the Viessmann Climate Devices integration."""
 
 import json
+from functools import cache
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import MagicMock
 
 import pytest
 
@@ -19,6 +19,8 @@ from custom_components.vi_climate_devices.sensor import (
 )
 from custom_components.vi_climate_devices.water_heater import ViClimateWaterHeater
 
+TRANSLATED_PLATFORMS = ["sensor", "binary_sensor", "number", "select", "water_heater"]
+
 
 def load_json(path: Path):
     """Load JSON data from a file."""
@@ -28,8 +30,9 @@ def load_json(path: Path):
         return json.load(f)
 
 
+@cache
 def get_entity_definitions(platform):
-    """Returns a list of EntityDescription objects for the platform."""
+    """Returns the EntityDescription objects for the platform."""
     descriptions = []
 
     if platform == "sensor":
@@ -54,21 +57,25 @@ def get_entity_definitions(platform):
 
     elif platform == "water_heater":
         # Arrange: Instantiate entity with mocks to read the REAL translation_key property
-        mock_coordinator = MagicMock()
-        mock_coordinator.data = {"test_key": MagicMock()}  # Device mock
-        mock_feature = MagicMock(name="heating.dhw.temperature.main")
+        # Plain namespaces carry only the attributes the constructor reads.
+        device = SimpleNamespace(gateway_serial="test_gw", id="0")
+        mock_coordinator = SimpleNamespace(data={"test_key": device})
+        mock_feature = SimpleNamespace(
+            name="heating.dhw.temperature.main", control=None
+        )
 
         entity = ViClimateWaterHeater(mock_coordinator, "test_key", mock_feature)
 
         # Now we get the actual key defined in the code ("dhw_water_heater")
         descriptions.append(SimpleNamespace(translation_key=entity.translation_key))
 
-    return descriptions
+    # Both tests reuse the cached result, so hand out an immutable sequence.
+    return tuple(descriptions)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def translations():
-    """Load all translation files."""
+    """Load all translation files once for every parametrized platform."""
     base_dir = Path(__file__).resolve().parent.parent
     component_dir = base_dir / "custom_components" / "vi_climate_devices"
 
@@ -79,25 +86,25 @@ def translations():
     }
 
 
-@pytest.mark.parametrize(
-    "platform", ["sensor", "binary_sensor", "number", "select", "water_heater"]
-)
-def test_entity_has_translation_key(platform):
-    """Verify that every entity description has a translation_key set."""
-    # Arrange: Load definitions for the specific platform.
-    descriptions = get_entity_definitions(platform)
+def _entity_description_params():
+    """Yield one test parameter per entity description across all platforms."""
+    for platform in TRANSLATED_PLATFORMS:
+        for index, desc in enumerate(get_entity_definitions(platform)):
+            key_name = getattr(desc, "key", "UNKNOWN")
+            yield pytest.param(platform, desc, id=f"{platform}-{index}-{key_name}")
 
-    # Act & Assert: Iterate through all descriptions and verify existence of translation_key.
-    for i, desc in enumerate(descriptions):
-        key_name = getattr(desc, "key", "UNKNOWN")
-        assert hasattr(desc, "translation_key") and desc.translation_key, (
-            f"EntityDescription at index {i} in {platform} is missing a translation_key. Key: {key_name}"
-        )
 
+@pytest.mark.parametrize(("platform", "desc"), _entity_description_params())
+def test_entity_has_translation_key(platform, desc):
+    """Verify that every entity description has a translation_key set."""
+    # Act & Assert: Verify the description defines a non-empty translation_key.
+    key_name = getattr(desc, "key", "UNKNOWN")
+    assert getattr(desc, "translation_key", None), (
+        f"EntityDescription in {platform} is missing a translation_key. Key: {key_name}"
+    )
 
-@pytest.mark.parametrize(
-    "platform", ["sensor", "binary_sensor", "number", "select", "water_heater"]
-)
+
+@pytest.mark.parametrize("platform", TRANSLATED_PLATFORMS)
 def test_translation_keys_exist(platform, translations):
     """Verify that all used translation keys exist in translation files."""
     # Arrange: Get unique translation keys used by the platform.
@@ -105,22 +112,15 @@ def test_translation_keys_exist(platform, translations):
     used_keys = {desc.translation_key for desc in descriptions}
 
     # Act: Check against loaded translation files.
-    missing_strings = []
-    missing_en = []
-    missing_de = []
-
-    for key in used_keys:
-        # Check strings.json (Developer Strings)
-        if key not in translations["strings"].get("entity", {}).get(platform, {}):
-            missing_strings.append(key)
-
-        # Check en.json (English)
-        if key not in translations["en"].get("entity", {}).get(platform, {}):
-            missing_en.append(key)
-
-        # Check de.json (German)
-        if key not in translations["de"].get("entity", {}).get(platform, {}):
-            missing_de.append(key)
+    missing_strings = (
+        used_keys - translations["strings"].get("entity", {}).get(platform, {}).keys()
+    )
+    missing_en = (
+        used_keys - translations["en"].get("entity", {}).get(platform, {}).keys()
+    )
+    missing_de = (
+        used_keys - translations["de"].get("entity", {}).get(platform, {}).keys()
+    )
 
     # Assert: Report any missing keys.
     error_msg = []
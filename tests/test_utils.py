@@ -1,144 +1,262 @@
 """Tests for Viessmann Climate Devices utilities."""
 
+import re
+
+import pytest
+
+from custom_components.vi_climate_devices.const import (
+    IGNORED_FEATURE_PATTERNS,
+    IGNORED_FEATURES,
+)
 from custom_components.vi_climate_devices.utils import (
     beautify_name,
     get_feature_bool_value,
     get_suggested_precision,
+    get_template_candidates,
+    get_template_prefix,
+    index_templates,
     is_feature_boolean_like,
+    is_feature_ignored,
 )
 
 
-def test_beautify_name():
+@pytest.mark.parametrize(
+    ("feature_name", "expected"),
+    [
+        # Standard dot-separated conversion.
+        ("heating.outside.temperature", "Outside Temperature"),
+        # Edge cases (None, Empty string).
+        (None, None),
+        ("", ""),
+        # Single word input.
+        ("simple", "Simple"),
+        # Extended cleaning logic (heating.heat, summary, Power).
+        (
+            "heating.heat.production.summary.dhw.currentDay",
+            "Production Dhw Current Day",
+        ),
+        ("device.power.consumption.limitation", "Consumption Limitation"),
+        (
+            "heating.boiler.sensors.temperature.commonSupply",
+            "Boiler Sensors Temperature Common Supply",
+        ),
+        (
+            "heating.bufferCylinder.sensors.temperature.main",
+            "Buffer Cylinder Sensors Temperature Main",
+        ),
+        ("heating.solar.power.production.day", "Solar Power Production Day"),
+        (
+            "heating.heatingRod.power.consumption.summary.dhw.currentDay",
+            "Heating Rod Consumption Dhw Current Day",
+        ),
+        (
+            "heating.power.consumption.summary.cooling.currentDay",
+            "Consumption Cooling Current Day",
+        ),
+        (
+            "heating.configuration.pressure.total.maximumPressure",
+            "Total Maximum Pressure",
+        ),
+        (
+            "heating.circuits.0.configuration.summerEco.absolute.threshold",
+            "Circuits 0 Summer Eco Absolute Threshold",
+        ),
+    ],
+)
+def test_beautify_name(feature_name, expected):
     """Test name beautification."""
 
-    # Act & Assert: Verify standard dot-separated conversion.
-    assert beautify_name("heating.outside.temperature") == "Outside Temperature"
+    # Act & Assert: Verify the feature name is converted as expected.
+    assert beautify_name(feature_name) == expected
 
-    # Act & Assert: Verify edge cases (None, Empty string).
-    assert beautify_name(None) is None
-    assert beautify_name("") == ""
 
-    # Act & Assert: Verify single word input.
-    assert beautify_name("simple") == "Simple"
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        # Python Booleans.
+        (True, True),
+        (False, True),
+        # String representations (Case Insensitive).
+        ("on", True),
+        ("On", True),
+        ("ON", True),
+        ("off", True),
+        ("OFF", True),
+        ("true", True),
+        ("false", True),
+        ("active", True),
+        ("inactive", True),
+        ("1", True),
+        ("0", True),
+        ("enabled", True),
+        ("disabled", True),
+        # Non-Boolean values.
+        ("standby", False),
+        ("error", False),
+        ("some_random_string", False),
+        (123, False),
+        (0, False),
+        (1.5, False),
+        (None, False),
+    ],
+)
+def test_is_feature_boolean_like(value, expected):
+    """Test boolean detection logic."""
 
-    # Act & Assert: Verify extended cleaning logic (heating.heat, summary, Power).
-    assert (
-        beautify_name("heating.heat.production.summary.dhw.currentDay")
-        == "Production Dhw Current Day"
-    )
-    assert (
-        beautify_name("device.power.consumption.limitation") == "Consumption Limitation"
-    )
-    assert (
-        beautify_name("heating.boiler.sensors.temperature.commonSupply")
-        == "Boiler Sensors Temperature Common Supply"
-    )
-    assert (
-        beautify_name("heating.bufferCylinder.sensors.temperature.main")
-        == "Buffer Cylinder Sensors Temperature Main"
-    )
+    # Act & Assert: Verify the value is classified as boolean-like or not.
+    assert is_feature_boolean_like(value) is expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        # Truthy values.
+        (True, True),
+        ("on", True),
+        ("active", True),
+        ("1", True),
+        ("enabled", True),
+        (1, True),
+        (1.0, True),
+        # Falsy values.
+        (False, False),
+        ("off", False),
+        ("inactive", False),
+        ("0", False),
+        ("disabled", False),
+        (0, False),
+        (0.0, False),
+        # Edge cases.
+        (None, None),
+        ("standby", None),
+        ("some_random_string", None),
+    ],
+)
+def test_get_feature_bool_value(value, expected):
+    """Test boolean interpretation logic."""
+
+    # Act & Assert: Verify the value is interpreted as expected.
+    assert get_feature_bool_value(value) is expected
+
+
+def test_is_feature_ignored():
+    """Test ignore list matching for exact names and regex patterns."""
+
+    # Act & Assert: Verify exact feature names from the ignore list.
+    assert is_feature_ignored("device.serial", IGNORED_FEATURES) is True
     assert (
-        beautify_name("heating.solar.power.production.day")
-        == "Solar Power Production Day"
+        is_feature_ignored("heating.power.consumption.total", IGNORED_FEATURES)
+        is True
     )
+
+    # Act & Assert: Verify regex patterns from the ignore list.
     assert (
-        beautify_name("heating.heatingRod.power.consumption.summary.dhw.currentDay")
-        == "Heating Rod Consumption Dhw Current Day"
+        is_feature_ignored(
+            "heating.circuits.0.heating.schedule",
+            IGNORED_FEATURES,
+            IGNORED_FEATURE_PATTERNS,
+        )
+        is True
     )
     assert (
-        beautify_name("heating.power.consumption.summary.cooling.currentDay")
-        == "Consumption Cooling Current Day"
+        is_feature_ignored(
+            "heating.dhw.sensors.temperature.hotWaterStorage.status",
+            IGNORED_FEATURES,
+            IGNORED_FEATURE_PATTERNS,
+        )
+        is True
     )
+
+    # Act & Assert: Verify regular features are kept.
     assert (
-        beautify_name("heating.configuration.pressure.total.maximumPressure")
-        == "Total Maximum Pressure"
+        is_feature_ignored(
+            "heating.sensors.temperature.outside",
+            IGNORED_FEATURES,
+            IGNORED_FEATURE_PATTERNS,
+        )
+        is False
     )
     assert (
-        beautify_name("heating.circuits.0.configuration.summerEco.absolute.threshold")
-        == "Circuits 0 Summer Eco Absolute Threshold"
+        is_feature_ignored(
+            "heating.dhw.temperature.main", IGNORED_FEATURES, IGNORED_FEATURE_PATTERNS
+        )
+        is False
     )
 
+    # Act & Assert: Verify plain lists (as patched in tests) are supported.
+    assert is_feature_ignored("custom.feature", ["custom.feature"]) is True
+    assert is_feature_ignored("custom.feature", []) is False
 
-def test_is_feature_boolean_like():
-    """Test boolean detection logic."""
-
-    # Act & Assert: Verify Python Booleans.
-    assert is_feature_boolean_like(True) is True
-    assert is_feature_boolean_like(False) is True
-
-    # Act & Assert: Verify String representations (Case Insensitive).
-    # These should all identify as boolean-like.
-    assert is_feature_boolean_like("on") is True
-    assert is_feature_boolean_like("On") is True
-    assert is_feature_boolean_like("ON") is True
-    assert is_feature_boolean_like("off") is True
-    assert is_feature_boolean_like("OFF") is True
-    assert is_feature_boolean_like("true") is True
-    assert is_feature_boolean_like("false") is True
-    assert is_feature_boolean_like("active") is True
-    assert is_feature_boolean_like("inactive") is True
-    assert is_feature_boolean_like("1") is True
-    assert is_feature_boolean_like("0") is True
-    assert is_feature_boolean_like("enabled") is True
-    assert is_feature_boolean_like("disabled") is True
-
-    # Act & Assert: Verify Non-Boolean values.
-    # These should NOT identify as boolean-like.
-    assert is_feature_boolean_like("standby") is False
-    assert is_feature_boolean_like("error") is False
-    assert is_feature_boolean_like("some_random_string") is False
-    assert is_feature_boolean_like(123) is False
-    assert is_feature_boolean_like(0) is False
-    assert is_feature_boolean_like(1.5) is False
-    assert is_feature_boolean_like(None) is False
-
-
-def test_get_feature_bool_value():
-    """Test boolean interpretation logic."""
 
-    # Act & Assert: Verification of various truthy values.
-    assert get_feature_bool_value(True) is True
-    assert get_feature_bool_value("on") is True
-    assert get_feature_bool_value("active") is True
-    assert get_feature_bool_value("1") is True
-    assert get_feature_bool_value("enabled") is True
-    assert get_feature_bool_value(1) is True
-    assert get_feature_bool_value(1.0) is True
-
-    # Act & Assert: Verification of various falsy values.
-    assert get_feature_bool_value(False) is False
-    assert get_feature_bool_value("off") is False
-    assert get_feature_bool_value("inactive") is False
-    assert get_feature_bool_value("0") is False
-    assert get_feature_bool_value("disabled") is False
-    assert get_feature_bool_value(0) is False
-    assert get_feature_bool_value(0.0) is False
-
-    # Act & Assert: Edge cases.
-    assert get_feature_bool_value(None) is None
-    assert get_feature_bool_value("standby") is None
-    assert get_feature_bool_value("some_random_string") is None
-
-
-def test_get_suggested_precision():
+@pytest.mark.parametrize(
+    ("step", "expected"),
+    [
+        # Whole Numbers.
+        (1.0, 0),
+        (1, 0),
+        (2.0, 0),
+        (5.0, 0),
+        # Decimals.
+        (0.5, 1),
+        (0.1, 1),
+        (0.01, 2),
+        (0.25, 2),
+        # Scientific notation.
+        (0.0001, 4),
+        (1e-06, 6),
+        # Edge cases.
+        (None, None),
+        (0.0, 0),
+    ],
+)
+def test_get_suggested_precision(step, expected):
     """Test precision detection logic based on step."""
 
-    # Act & Assert: Verify Whole Numbers.
-    assert get_suggested_precision(1.0) == 0
-    assert get_suggested_precision(1) == 0
-    assert get_suggested_precision(2.0) == 0
-    assert get_suggested_precision(5.0) == 0
-
-    # Act & Assert: Verify Decimals.
-    assert get_suggested_precision(0.5) == 1
-    assert get_suggested_precision(0.1) == 1
-    assert get_suggested_precision(0.01) == 2
-    assert get_suggested_precision(0.25) == 2
-
-    # Act & Assert: Verify Scientific/Edge cases.
-    assert get_suggested_precision(0.0001) == 4
-    assert get_suggested_precision(1e-06) == 6
-
-    # Act & Assert: Edge cases.
-    assert get_suggested_precision(None) is None
-    assert get_suggested_precision(0.0) == 0
+    # Act & Assert: Verify the precision derived from the step.
+    assert get_suggested_precision(step) == expected
+
+
+def test_template_index():
+    """Test that templates are only offered for matching feature prefixes."""
+
+    # Arrange: Build templates with literal and non-literal prefixes.
+    circuit_template = {"pattern": re.compile(r"^heating\.circuits\.(\d+)\.name$")}
+    compressor_template = {
+        "pattern": re.compile(r"^heating\.compressors\.(\d+)\.active$")
+    }
+    wildcard_template = {"pattern": re.compile(r"^heating\..*\.schedule$")}
+
+    # Act: Index the templates by prefix.
+    index = index_templates([circuit_template, compressor_template, wildcard_template])
+
+    # Assert: Verify the extracted prefixes.
+    assert get_template_prefix(circuit_template["pattern"]) == "heating.circuits"
+    assert get_template_prefix(wildcard_template["pattern"]) == ""
+
+    # Assert: Verify only relevant templates are returned as candidates.
+    assert get_template_candidates(index, "heating.circuits.0.name") == [
+        circuit_template,
+        wildcard_template,
+    ]
+    assert get_template_candidates(index, "heating.dhw.temperature.main") == [
+        wildcard_template
+    ]
+
+
+def test_template_candidates_keep_template_order():
+    """Test that catch-all templates keep their position among prefixed ones."""
+
+    # Arrange: Put a catch-all template between two prefixed templates.
+    first_template = {"pattern": re.compile(r"^heating\.circuits\.(\d+)\.name$")}
+    wildcard_template = {"pattern": re.compile(r"^heating\..*\.name$")}
+    last_template = {"pattern": re.compile(r"^heating\.circuits\.(\d+)\.type$")}
+
+    # Act: Index the templates by prefix.
+    index = index_templates([first_template, wildcard_template, last_template])
+
+    # Assert: Verify candidates follow the original template order.
+    assert get_template_candidates(index, "heating.circuits.0.name") == [
+        first_template,
+        wildcard_template,
+        last_template,
+    ]
@@ -1,7 +1,5 @@
 """Tests for ViClimate water heater entities."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
-
 import pytest
 from homeassistant.components.water_heater import (
     SERVICE_SET_OPERATION_MODE,
@@ -12,240 +10,169 @@ from homeassistant.components.water_heater import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
-from pytest_homeassistant_custom_component.common import MockConfigEntry
 from vi_api_client.models import CommandResponse
 
-from custom_components.vi_climate_devices.const import DOMAIN
 from custom_components.vi_climate_devices.water_heater import (
     FEATURE_MODE,
     FEATURE_TARGET_TEMP,
 )
 
 
-@pytest.mark.asyncio
-async def test_water_heater_creation_and_services(hass: HomeAssistant, mock_client):
+async def test_water_heater_creation_and_services(
+    hass: HomeAssistant, mock_client, setup_integration
+):
     """Test water heater entity creation and service calls."""
-    # Arrange: Mock Config Entry.
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        data={
-            "client_id": "123",
-            "token": {
-                "access_token": "mock",
-                "refresh_token": "mock",
-                "expires_at": 9999999999,
-                "token_type": "Bearer",
-            },
-        },
-    )
-    entry.add_to_hass(hass)
+    # Arrange: Record set_feature calls to verify them (returns tuple in v1.0.0).
+    set_feature_calls = []
 
-    # Spy on set_feature to verify service calls (returns tuple in v1.0.0).
     async def mock_set_feature(device, feature, value):
+        set_feature_calls.append((feature.name, value))
         response = CommandResponse(
             success=True, message=None, reason="COMMAND_EXECUTION_SUCCESS"
         )
         return (response, device)
 
-    mock_client.set_feature = AsyncMock(side_effect=mock_set_feature)
-
-    with (
-        patch(
-            "custom_components.vi_climate_devices.ViessmannClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "homeassistant.helpers.config_entry_oauth2_flow.async_get_config_entry_implementation",
-            return_value=MagicMock(),
-        ),
-        patch(
-            "homeassistant.helpers.config_entry_oauth2_flow.OAuth2Session.async_ensure_token_valid",
-            return_value=None,
-        ),
-        patch("custom_components.vi_climate_devices.HAAuth"),
-    ):
-        # Act: Load Integration.
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
-
-        # Get the Water Heater Entity.
-        entity_id = "water_heater.vitocal250a_dhw_water_heater"
-        state = hass.states.get(entity_id)
-        assert state is not None
-
-        # Verify Initial Attributes from Fixture.
-        # Temp: 55.0, Current: 46.8, Mode: efficient -> STATE_ECO.
-        assert state.state == STATE_ECO
-        assert float(state.attributes["current_temperature"]) == 46.8
-        assert float(state.attributes["temperature"]) == 55.0
-        assert state.attributes["min_temp"] == 10.0
-        assert state.attributes["max_temp"] == 60.0
-        # Verify constraints on entity
-        component = hass.data.get("water_heater")
-        entity = component.get_entity(entity_id)
-        # Use getattr because property might not exist in all HA versions
-        assert (
-            getattr(entity, "target_temperature_step", None) == 1.0
-            or getattr(entity, "_attr_target_temperature_step", None) == 1.0
-        )
-        assert entity.suggested_display_precision == 0
+    mock_client.set_feature = mock_set_feature
+
+    # Act: Load Integration.
+    entry = await setup_integration(mock_client)
+
+    # Get the Water Heater Entity.
+    entity_id = "water_heater.vitocal250a_dhw_water_heater"
+    state = hass.states.get(entity_id)
+    assert state is not None
+
+    # Verify Initial Attributes from Fixture.
+    # Temp: 55.0, Current: 46.8, Mode: efficient -> STATE_ECO.
+    assert state.state == STATE_ECO
+    assert float(state.attributes["current_temperature"]) == 46.8
+    assert float(state.attributes["temperature"]) == 55.0
+    assert state.attributes["min_temp"] == 10.0
+    assert state.attributes["max_temp"] == 60.0
+    # Verify constraints on entity
+    component = hass.data.get("water_heater")
+    entity = component.get_entity(entity_id)
+    # Use getattr because property might not exist in all HA versions
+    assert (
+        getattr(entity, "target_temperature_step", None) == 1.0
+        or getattr(entity, "_attr_target_temperature_step", None) == 1.0
+    )
+    assert entity.suggested_display_precision == 0
 
-        # Verify it is also in attributes (via extra_state_attributes)
-        assert state.attributes["target_temp_step"] == 1.0
-        assert state.attributes["supported_features"] == (
-            WaterHeaterEntityFeature.TARGET_TEMPERATURE
-            | WaterHeaterEntityFeature.OPERATION_MODE
-        )
+    # Verify it is also in attributes (via extra_state_attributes)
+    assert state.attributes["target_temp_step"] == 1.0
+    assert state.attributes["supported_features"] == (
+        WaterHeaterEntityFeature.TARGET_TEMPERATURE
+        | WaterHeaterEntityFeature.OPERATION_MODE
+    )
 
-        # Act: Set Temperature to 45.0.
-        await hass.services.async_call(
-            "water_heater",
-            SERVICE_SET_TEMPERATURE,
-            {"entity_id": entity_id, "temperature": 45.0},
-            blocking=True,
-        )
+    # Act: Set Temperature to 45.0.
+    await hass.services.async_call(
+        "water_heater",
+        SERVICE_SET_TEMPERATURE,
+        {"entity_id": entity_id, "temperature": 45.0},
+        blocking=True,
+    )
+
+    # Verify Service Call (Set Temp).
+    # We expect set_feature to be called with "heating.dhw.temperature.main" and 45.0.
+    assert set_feature_calls == [(FEATURE_TARGET_TEMP, 45.0)]
+
+    # Verify Optimistic Update (Temp).
+    state = hass.states.get(entity_id)
+    assert float(state.attributes["temperature"]) == 45.0
+
+    # Reset recorded calls.
+    set_feature_calls.clear()
+
+    # Act: Set Mode to STATE_PERFORMANCE.
+    # Based on mapping, STATE_PERFORMANCE maps to ["comfort", "efficientWithMinComfort"].
+    # Fixture has "efficientWithMinComfort" available, so it should use that.
+    await hass.services.async_call(
+        "water_heater",
+        SERVICE_SET_OPERATION_MODE,
+        {"entity_id": entity_id, "operation_mode": STATE_PERFORMANCE},
+        blocking=True,
+    )
+
+    # Verify Service Call (Set Mode).
+    assert set_feature_calls == [(FEATURE_MODE, "efficientWithMinComfort")]
+
+    # Verify Optimistic Update (Mode).
+    state = hass.states.get(entity_id)
+    assert state.state == STATE_PERFORMANCE
 
-        # Verify Service Call (Set Temp).
-        # We expect set_feature to be called with "heating.dhw.temperature.main" and 45.0.
-        # Note: Since set_feature is called multiple times if we chain tests, we check specific call.
-        assert mock_client.set_feature.call_count == 1
-        args, _ = mock_client.set_feature.call_args
-        assert args[1].name == FEATURE_TARGET_TEMP
-        assert args[2] == 45.0
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
 
-        # Verify Optimistic Update (Temp).
-        state = hass.states.get(entity_id)
-        assert float(state.attributes["temperature"]) == 45.0
 
-        # Reset Mock.
-        mock_client.set_feature.reset_mock()
+async def test_water_heater_error_handling(
+    hass: HomeAssistant, mock_client, setup_integration
+):
+    """Test water heater error handling and rollback (Option B)."""
+
+    # Arrange: Simulate an API error.
+    async def mock_set_feature_error(device, feature, value):
+        raise HomeAssistantError("API Error")
+
+    mock_client.set_feature = mock_set_feature_error
 
-        # Act: Set Mode to STATE_PERFORMANCE.
-        # Based on mapping, STATE_PERFORMANCE maps to ["comfort", "efficientWithMinComfort"].
-        # Fixture has "efficientWithMinComfort" available, so it should use that.
+    # Act: Initialize integration.
+    entry = await setup_integration(mock_client)
+
+    entity_id = "water_heater.vitocal250a_dhw_water_heater"
+    state = hass.states.get(entity_id)
+    original_temp = float(state.attributes["temperature"])
+
+    # Act: Try to set temperature (Should fail).
+    with pytest.raises(HomeAssistantError):
         await hass.services.async_call(
             "water_heater",
-            SERVICE_SET_OPERATION_MODE,
-            {"entity_id": entity_id, "operation_mode": STATE_PERFORMANCE},
+            SERVICE_SET_TEMPERATURE,
+            {"entity_id": entity_id, "temperature": 40.0},
             blocking=True,
         )
 
-        # Verify Service Call (Set Mode).
-        assert mock_client.set_feature.call_count == 1
-        args, _ = mock_client.set_feature.call_args
-        assert args[1].name == FEATURE_MODE
-        assert args[2] == "efficientWithMinComfort"
-
-        # Verify Optimistic Update (Mode).
-        state = hass.states.get(entity_id)
-        assert state.state == STATE_PERFORMANCE
-
-        await hass.config_entries.async_unload(entry.entry_id)
-        await hass.async_block_till_done()
+    # Assert: Rollback occurred.
+    state = hass.states.get(entity_id)
+    state = hass.states.get(entity_id)
+    assert float(state.attributes["temperature"]) == original_temp
 
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
 
-@pytest.mark.asyncio
-async def test_water_heater_error_handling(hass: HomeAssistant, mock_client):
-    """Test water heater error handling and rollback (Option B)."""
-    # Arrange: Setup integration.
-    entry = MockConfigEntry(domain=DOMAIN, data={"client_id": "123", "token": "abc"})
-    entry.add_to_hass(hass)
 
-    # Simulate API Error.
-    async def mock_set_feature_error(device, feature, value):
-        raise HomeAssistantError("API Error")
-
-    mock_client.set_feature = AsyncMock(side_effect=mock_set_feature_error)
-
-    with (
-        patch(
-            "custom_components.vi_climate_devices.ViessmannClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "homeassistant.helpers.config_entry_oauth2_flow.async_get_config_entry_implementation",
-            return_value=MagicMock(),
-        ),
-        patch(
-            "homeassistant.helpers.config_entry_oauth2_flow.OAuth2Session.async_ensure_token_valid",
-            return_value=None,
-        ),
-        patch("custom_components.vi_climate_devices.HAAuth"),
-    ):
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
-
-        entity_id = "water_heater.vitocal250a_dhw_water_heater"
-        state = hass.states.get(entity_id)
-        original_temp = float(state.attributes["temperature"])
-
-        # Act: Try to set temperature (Should fail).
-        with pytest.raises(HomeAssistantError):
-            await hass.services.async_call(
-                "water_heater",
-                SERVICE_SET_TEMPERATURE,
-                {"entity_id": entity_id, "temperature": 40.0},
-                blocking=True,
-            )
-
-        # Assert: Rollback occurred.
-        state = hass.states.get(entity_id)
-        state = hass.states.get(entity_id)
-        assert float(state.attributes["temperature"]) == original_temp
-
-        await hass.config_entries.async_unload(entry.entry_id)
-        await hass.async_block_till_done()
-
-
-@pytest.mark.asyncio
-async def test_water_heater_api_rejection(hass: HomeAssistant, mock_client):
+async def test_water_heater_api_rejection(
+    hass: HomeAssistant, mock_client, setup_integration
+):
     """Test water heater handling of API logical rejection (success=False)."""
-    # Arrange: Setup integration.
-    entry = MockConfigEntry(domain=DOMAIN, data={"client_id": "123", "token": "abc"})
-    entry.add_to_hass(hass)
-
-    # Simulate API Logical Failure.
 
+    # Arrange: Simulate an API logical failure.
     async def mock_set_feature_rejection(device, feature, value):
         response = CommandResponse(success=False, message="Locked", reason=None)
         return (response, device)
 
-    mock_client.set_feature = AsyncMock(side_effect=mock_set_feature_rejection)
-
-    with (
-        patch(
-            "custom_components.vi_climate_devices.ViessmannClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "homeassistant.helpers.config_entry_oauth2_flow.async_get_config_entry_implementation",
-            return_value=MagicMock(),
-        ),
-        patch(
-            "homeassistant.helpers.config_entry_oauth2_flow.OAuth2Session.async_ensure_token_valid",
-            return_value=None,
-        ),
-        patch("custom_components.vi_climate_devices.HAAuth"),
-    ):
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
-
-        entity_id = "water_heater.vitocal250a_dhw_water_heater"
-        state = hass.states.get(entity_id)
-        original_temp = float(state.attributes["temperature"])
-
-        # Act: Try to set temperature.
-        with pytest.raises(HomeAssistantError, match="Command rejected: Locked"):
-            await hass.services.async_call(
-                "water_heater",
-                SERVICE_SET_TEMPERATURE,
-                {"entity_id": entity_id, "temperature": 40.0},
-                blocking=True,
-            )
-
-        # Assert: Rollback occurred.
-        state = hass.states.get(entity_id)
-        assert float(state.attributes["temperature"]) == original_temp
-
-        await hass.config_entries.async_unload(entry.entry_id)
-        await hass.async_block_till_done()
+    mock_client.set_feature = mock_set_feature_rejection
+
+    # Act: Initialize integration.
+    entry = await setup_integration(mock_client)
+
+    entity_id = "water_heater.vitocal250a_dhw_water_heater"
+    state = hass.states.get(entity_id)
+    original_temp = float(state.attributes["temperature"])
+
+    # Act: Try to set temperature.
+    with pytest.raises(HomeAssistantError, match="Command rejected: Locked"):
+        await hass.services.async_call(
+            "water_heater",
+            SERVICE_SET_TEMPERATURE,
+            {"entity_id": entity_id, "temperature": 40.0},
+            blocking=True,
+        )
+
+    # Assert: Rollback occurred.
+    state = hass.states.get(entity_id)
+    assert float(state.attributes["temperature"]) == original_temp
+
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()